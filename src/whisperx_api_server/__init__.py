@@ -3,14 +3,29 @@ import os
 os.environ['LD_LIBRARY_PATH'] = '/usr/lib/x86_64-linux-gnu:' + os.environ.get('LD_LIBRARY_PATH', '')
 
 # PyTorch 2.6 compatibility patch - MUST be first thing that runs
-# This patches torch.load to use weights_only=False by default for trusted PyAnnote models
+# PyTorch 2.6 defaults torch.load to weights_only=True, which trusted PyAnnote
+# checkpoints can't satisfy. The patch only relaxes that default inside
+# `trusted_torch_load()`; every other caller keeps the safe default.
+import contextlib
+import contextvars
 import torch
 
 _original_load = torch.load
 
+_allow_unsafe_load = contextvars.ContextVar("allow_unsafe_load", default=False)
+
+@contextlib.contextmanager
+def trusted_torch_load():
+    """Default torch.load to weights_only=False for trusted PyAnnote model loading."""
+    token = _allow_unsafe_load.set(True)
+    try:
+        yield
+    finally:
+        _allow_unsafe_load.reset(token)
+
 def _safe_load(f, map_location=None, pickle_module=None, *, weights_only=None, mmap=None, **pickle_load_args):
-    """Wrapper that defaults weights_only to False for PyAnnote model compatibility."""
-    if weights_only is None:
+    """Wrapper that defaults weights_only to False only within trusted_torch_load()."""
+    if weights_only is None and _allow_unsafe_load.get():
         weights_only = False
     return _original_load(f, map_location=map_location, pickle_module=pickle_module, 
                          weights_only=weights_only, mmap=mmap, **pickle_load_args)
@@ -2,42 +2,119 @@
 Database setup and session management.
 """
 
-from sqlalchemy import create_engine
-from sqlalchemy.orm import sessionmaker, declarative_base
+import json
+
+from sqlalchemy import create_engine, event, inspect, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import QueuePool
 from whisperx_api_server.dependencies import get_config
+import logging
 import os
 
+logger = logging.getLogger(__name__)
+
 config = get_config()
 # Database path - configurable via environment variable
 DATABASE_PATH = os.getenv("DATABASE_PATH", "/workspace/data/whisperx.db")
 
-# Create database URL
+# Create database URLs; the sync engine is only used for schema setup in init_db
 DATABASE_URL = f"sqlite:///{DATABASE_PATH}"
+ASYNC_DATABASE_URL = f"sqlite+aiosqlite:///{DATABASE_PATH}"
+
+# PRAGMAs applied to every new DBAPI connection. WAL lets the API readers and
+# the background worker proceed concurrently instead of serializing on the
+# rollback journal.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA busy_timeout=5000",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",
+    "PRAGMA cache_size=-20000",
+)
 
 # Create engine with SQLite-specific settings
 engine = create_engine(
     DATABASE_URL,
-    connect_args={"check_same_thread": False},  # Required for SQLite with threading
+    connect_args={
+        "check_same_thread": False,  # Required for SQLite with threading
+        "isolation_level": None,  # Let SQLAlchemy emit BEGIN itself (see below)
+    },
+    poolclass=QueuePool,
+    pool_size=5,
+    max_overflow=10,
+    pool_pre_ping=True,
+    pool_recycle=1800,
     echo=False,  # Set to True for SQL debugging
 )
 
-# Session factory
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+@event.listens_for(engine, "connect")
+def _set_sqlite_pragmas(dbapi_connection, connection_record):
+    """Apply SQLITE_PRAGMAS to each new raw connection."""
+    cursor = dbapi_connection.cursor()
+    try:
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+    finally:
+        cursor.close()
+
+
+@event.listens_for(engine, "begin")
+def _do_begin(conn):
+    """
+    With the driver's implicit transactions disabled, start transactions
+    explicitly so they only begin when SQLAlchemy actually needs one.
+    """
+    conn.exec_driver_sql("BEGIN")
+
+
+def create_async_db_engine(**kwargs) -> AsyncEngine:
+    """
+    Create an async engine with the same connection setup as `engine`.
+
+    An async engine's pool is bound to the event loop that uses it, so code
+    running on another loop (like the background worker) must create its own.
+    """
+    options = {
+        "connect_args": {"isolation_level": None},
+        "pool_size": 5,
+        "max_overflow": 10,
+        "pool_pre_ping": True,
+        "pool_recycle": 1800,
+        "echo": False,
+    }
+    options.update(kwargs)
+    async_engine = create_async_engine(ASYNC_DATABASE_URL, **options)
+    event.listen(async_engine.sync_engine, "connect", _set_sqlite_pragmas)
+    event.listen(async_engine.sync_engine, "begin", _do_begin)
+    return async_engine
+
+
+def create_session_factory(bind: AsyncEngine) -> async_sessionmaker[AsyncSession]:
+    """
+    Create an AsyncSession factory for `bind`.
+    Objects stay loaded after commit so they can be used once the session is closed.
+    """
+    return async_sessionmaker(bind=bind, autoflush=False, expire_on_commit=False)
+
+
+# Async engine and session factory for the API's event loop
+async_engine = create_async_db_engine()
+SessionLocal = create_session_factory(async_engine)
 
 # Base class for models
 Base = declarative_base()
 
 
-def get_db():
+async def get_db():
     """
-    Dependency that provides a database session.
+    Dependency that provides an async database session.
     Use with FastAPI's Depends().
     """
-    db = SessionLocal()
-    try:
+    async with SessionLocal() as db:
         yield db
-    finally:
-        db.close()
 
 
 def init_db():
@@ -45,9 +122,52 @@ def init_db():
     Initialize the database by creating all tables.
     Called on application startup.
     """
-    from whisperx_api_server.db_models import TranscriptionJob  # noqa: F401
+    from whisperx_api_server.db_models import TranscriptionJob
 
     # Create database directory if it doesn't exist
     os.makedirs(os.path.dirname(DATABASE_PATH), exist_ok=True)
     
     Base.metadata.create_all(bind=engine)
+
+    # create_all only builds indexes alongside new tables, so bring indexes
+    # of databases created by older versions up to date.
+    with engine.begin() as conn:
+        conn.exec_driver_sql("DROP INDEX IF EXISTS ix_transcription_jobs_status")
+    for index in TranscriptionJob.__table__.indexes:
+        index.create(bind=engine, checkfirst=True)
+
+    _migrate_transcript_column()
+
+
+def _migrate_transcript_column():
+    """
+    Move transcripts stored as JSON in the legacy `transcript` Text column
+    into the compressed `transcript_blob` column, then drop the old column.
+    """
+    from whisperx_api_server.db_models import pack_transcript
+
+    columns = {c["name"] for c in inspect(engine).get_columns("transcription_jobs")}
+
+    with engine.begin() as conn:
+        if "transcript_blob" not in columns:
+            conn.exec_driver_sql("ALTER TABLE transcription_jobs ADD COLUMN transcript_blob BLOB")
+
+        if "transcript" not in columns:
+            return
+
+        rows = conn.execute(
+            text("SELECT id, transcript FROM transcription_jobs WHERE transcript IS NOT NULL")
+        ).all()
+        for job_id, transcript in rows:
+            try:
+                blob = pack_transcript(json.loads(transcript))
+            except (TypeError, ValueError):
+                logger.warning(f"Dropping unparseable transcript for job {job_id}")
+                blob = None
+            conn.execute(
+                text("UPDATE transcription_jobs SET transcript_blob = :blob WHERE id = :id"),
+                {"blob": blob, "id": job_id},
+            )
+
+        conn.exec_driver_sql("ALTER TABLE transcription_jobs DROP COLUMN transcript")
+        logger.info(f"Migrated {len(rows)} transcripts to compressed storage")
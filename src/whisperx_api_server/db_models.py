@@ -4,7 +4,11 @@ SQLAlchemy database models for job persistence.
 
 import uuid
 from datetime import datetime
-from sqlalchemy import Column, String, Text, Boolean, Integer, Float, DateTime
+from typing import Any, Iterator
+
+import msgpack
+import zstandard
+from sqlalchemy import Column, String, Text, Boolean, Integer, Float, DateTime, Index, LargeBinary
 from sqlalchemy.sql import func
 
 from whisperx_api_server.database import Base
@@ -21,14 +25,14 @@ class TranscriptionJob(Base):
     id = Column(String(36), primary_key=True, default=lambda: str(uuid.uuid4()))
 
     # Status: pending, processing, completed, failed
-    status = Column(String(20), nullable=False, default="pending", index=True)
+    status = Column(String(20), nullable=False, default="pending")
 
     # File information
     audio_path = Column(Text, nullable=False)
     original_filename = Column(Text, nullable=True)
 
-    # Transcription result (JSON string)
-    transcript = Column(Text, nullable=True)
+    # Transcription result (zstd-compressed msgpack, see pack_transcript)
+    transcript_blob = Column(LargeBinary, nullable=True)
 
     # Error message if failed
     error_message = Column(Text, nullable=True)
@@ -52,5 +56,75 @@ class TranscriptionJob(Base):
     updated_at = Column(DateTime, nullable=False, server_default=func.now(), onupdate=func.now())
     completed_at = Column(DateTime, nullable=True)
 
+    __table_args__ = (
+        # Worker claim: WHERE status = 'pending' ORDER BY created_at ASC.
+        # Also serves status-only lookups through its left prefix.
+        Index("ix_jobs_status_created", "status", "created_at"),
+        # list_jobs: ORDER BY created_at DESC
+        Index("ix_jobs_created_desc", created_at.desc()),
+    )
+
     def __repr__(self):
         return f"<TranscriptionJob(id={self.id}, status={self.status})>"
+
+
+def _msgpack_default(obj: Any) -> Any:
+    """Convert numpy scalars found in WhisperX results to plain Python values."""
+    if hasattr(obj, "item"):
+        return obj.item()
+    raise TypeError(f"Cannot serialize object of type {type(obj).__name__}")
+
+
+def pack_transcript(data: dict) -> bytes:
+    """Encode a transcript dict for storage in `transcript_blob`."""
+    packed = msgpack.packb(data, default=_msgpack_default)
+    return zstandard.ZstdCompressor(level=3).compress(packed)
+
+
+def unpack_transcript(blob: bytes) -> dict:
+    """
+    Decode a `transcript_blob` value back into a transcript dict.
+    Raises ValueError if the blob is corrupt.
+    """
+    try:
+        return msgpack.unpackb(zstandard.ZstdDecompressor().decompress(blob))
+    except (zstandard.ZstdError, msgpack.UnpackException) as e:
+        raise ValueError(f"Invalid transcript blob: {e}") from e
+
+
+_BLOB_ERRORS = (zstandard.ZstdError, msgpack.UnpackException, msgpack.OutOfData)
+
+
+def iter_transcript_segments(blob: bytes) -> Iterator[dict]:
+    """
+    Return an iterator over the segments of a `transcript_blob`, decompressing
+    and decoding incrementally instead of materializing the whole transcript.
+
+    The blob is read up to the start of the segments array before returning,
+    so a corrupt header raises ValueError here rather than mid-iteration.
+    Corruption further into the blob still raises ValueError while iterating.
+    """
+    reader = zstandard.ZstdDecompressor().stream_reader(blob)
+    unpacker = msgpack.Unpacker(reader)
+    try:
+        count = _seek_transcript_segments(unpacker)
+    except _BLOB_ERRORS as e:
+        raise ValueError(f"Invalid transcript blob: {e}") from e
+    return _unpack_segments(unpacker, count)
+
+
+def _seek_transcript_segments(unpacker: msgpack.Unpacker) -> int:
+    """Advance `unpacker` to the first segment and return the segment count."""
+    for _ in range(unpacker.read_map_header()):
+        if unpacker.unpack() == "segments":
+            return unpacker.read_array_header()
+        unpacker.skip()
+    return 0
+
+
+def _unpack_segments(unpacker: msgpack.Unpacker, count: int) -> Iterator[dict]:
+    try:
+        for _ in range(count):
+            yield unpacker.unpack()
+    except _BLOB_ERRORS as e:
+        raise ValueError(f"Invalid transcript blob: {e}") from e
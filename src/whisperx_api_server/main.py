@@ -95,6 +95,9 @@ async def lifespan(app: FastAPI):
     worker.stop()
     logger.info("Background job worker stopped")
 
+    from whisperx_api_server.database import async_engine
+    await async_engine.dispose()
+
 def create_app() -> FastAPI:
     config = get_config()
     setup_logger(config.log_level)
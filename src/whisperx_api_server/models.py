@@ -3,8 +3,8 @@ import asyncio
 import contextlib
 import torch
 import gc
-from collections import defaultdict
-from asyncio import Lock
+from collections import Counter, defaultdict
+from threading import Lock
 from typing import Union, List, Optional, Tuple, Any
 
 from whisperx import asr as whisperx_asr
@@ -12,11 +12,14 @@ from whisperx import transcribe as whisperx_transcribe
 from whisperx import alignment as whisperx_alignment
 from whisperx import diarize as whisperx_diarize
 
+from whisperx_api_server import trusted_torch_load
 from whisperx_api_server.dependencies import get_config
 
 logger = logging.getLogger(__name__)
 
-# Global caches
+# Global caches. They are shared by the API's event loop and every job worker
+# thread's own loop, so they are guarded by thread locks: an asyncio.Lock never
+# wakes a waiter running on a different loop.
 model_instances = {}
 model_locks = defaultdict(Lock)
 
@@ -32,6 +35,27 @@ alignment_cache_mod_lock = Lock()
 transcribe_pipeline_instances = {}
 transcribe_locks = defaultdict(Lock)
 
+# Number of in-flight transcriptions using each Whisper model (see
+# acquire_model_instance); unload_whisper_model leaves those loaded
+model_refcounts = Counter()
+model_refcounts_lock = Lock()
+
+async def acquire_thread_lock(lock: Any, poll_interval: float = 0.05):
+    """
+    Acquire a threading lock or semaphore from async code without blocking the
+    event loop or tying up an executor thread while waiting.
+    """
+    while not lock.acquire(blocking=False):
+        await asyncio.sleep(poll_interval)
+
+@contextlib.asynccontextmanager
+async def hold_thread_lock(lock: Any):
+    await acquire_thread_lock(lock)
+    try:
+        yield
+    finally:
+        lock.release()
+
 def unload_model_object(model_obj: Any):
     if model_obj is None:
         return
@@ -45,6 +69,27 @@ def unload_model_object(model_obj: Any):
     gc.collect()
     torch.cuda.empty_cache()
 
+def unload_whisper_model(model_name: str) -> bool:
+    """
+    Drop a Whisper model from every cache that references it and free its weights.
+    Returns False, leaving the model loaded, if a transcription is still using it.
+    """
+    with model_refcounts_lock:
+        if model_refcounts[model_name]:
+            return False
+        model_obj = model_instances.pop(model_name, None)
+    if model_obj is None:
+        return True
+    # Cached transcribe pipelines wrap the same model object
+    for key, pipeline in list(transcribe_pipeline_instances.items()):
+        if getattr(pipeline, "model", None) is model_obj:
+            transcribe_pipeline_instances.pop(key, None)
+    # WhisperModel has no .to(); the CTranslate2 model has to be unloaded explicitly
+    with contextlib.suppress(Exception):
+        model_obj.model.unload_model()
+    unload_model_object(model_obj)
+    return True
+
 class CustomWhisperModel(whisperx_asr.WhisperModel):
     def __init__(
         self,
@@ -141,7 +186,7 @@ async def _get_or_init_model(
         logger.info(log_reuse.format(key=key))
         return cache_dict[key]
 
-    async with lock_dict[key]:
+    async with hold_thread_lock(lock_dict[key]):
         # Double-check after acquiring the lock
         if key not in cache_dict:
             logger.info(log_init.format(key=key))
@@ -163,6 +208,25 @@ async def load_model_instance(model_name: str):
         init_func=lambda: asyncio.to_thread(initialize_model, model_name),
     )
 
+async def acquire_model_instance(model_name: str):
+    """
+    Like load_model_instance, but keeps the model from being unloaded until
+    release_model_instance is called. Use it for anything that runs inference.
+    """
+    with model_refcounts_lock:
+        model_refcounts[model_name] += 1
+    try:
+        return await load_model_instance(model_name)
+    except BaseException:
+        release_model_instance(model_name)
+        raise
+
+def release_model_instance(model_name: str):
+    with model_refcounts_lock:
+        model_refcounts[model_name] -= 1
+        if model_refcounts[model_name] <= 0:
+            del model_refcounts[model_name]
+
 # -------------------------------------------------------------------------
 # Transcribe pipeline loading
 # -------------------------------------------------------------------------
@@ -191,16 +255,28 @@ async def load_transcribe_pipeline_cached(
     )
 
     def _init_pipeline():
-        return whisperx_transcribe.load_model(
-            whisper_arch=whispermodel.model_size_or_path,
-            device=whispermodel.device,
-            compute_type=whispermodel.compute_type,
-            language=language,
-            vad_model=config.whisper.vad_model,
-            vad_method=config.whisper.vad_method,
-            vad_options=config.whisper.vad_options,
-            task=task,
-        )
+        # The pyannote VAD checkpoint needs a full (pickle) torch.load
+        with trusted_torch_load():
+            return whisperx_transcribe.load_model(
+                whisper_arch=whispermodel.model_size_or_path,
+                device=whispermodel.device,
+                compute_type=whispermodel.compute_type,
+                language=language,
+                # Reuse the already-loaded weights instead of loading a second copy
+                model=whispermodel,
+                vad_model=config.whisper.vad_model,
+                vad_method=config.whisper.vad_method,
+                vad_options=config.whisper.vad_options,
+                task=task,
+            )
+
+    # The pipeline wraps this exact model object, which the key doesn't capture.
+    # If the model has been reloaded since, the cached pipeline holds the old,
+    # possibly unloaded weights, so build a new one around the current model.
+    cached = transcribe_pipeline_instances.get(str(key))
+    if cached is not None and getattr(cached, "model", None) is not whispermodel:
+        logger.info(f"Rebuilding transcribe pipeline for a reloaded model: {key}")
+        transcribe_pipeline_instances.pop(str(key), None)
 
     pipeline = await _get_or_init_model(
         key=str(key),
@@ -233,7 +309,7 @@ async def _cleanup_alignment_cache_whitelist():
     if not whitelist:
         return
 
-    async with alignment_cache_mod_lock:
+    async with hold_thread_lock(alignment_cache_mod_lock):
         for key in list(align_model_instances.keys()): # noqa: S7504
             if key not in whitelist:
                 logger.info(f"Unloading alignment model for {key} (not in whitelist).")
@@ -306,7 +382,7 @@ async def load_align_model_cached(
 
     # If caching is disabled, remove it immediately and free GPU memory
     if not config.alignment.cache:
-        async with alignment_cache_mod_lock:
+        async with hold_thread_lock(alignment_cache_mod_lock):
             removed_data = align_model_instances.pop(cache_key, None)
             if removed_data is not None:
                 logger.info(f"Unloading alignment model from cache (disabled): {cache_key}")
@@ -331,7 +407,8 @@ async def load_diarize_model_cached(model_name: str):
 
     def _init_diarization():
         logger.info(f"Loading diarization pipeline for model: {model_name} with device: {inference_device}")
-        return whisperx_diarize.DiarizationPipeline(model_name=model_name, device=inference_device)
+        with trusted_torch_load():
+            return whisperx_diarize.DiarizationPipeline(model_name=model_name, device=inference_device)
 
     diarize_model = await _get_or_init_model(
         key=model_name,
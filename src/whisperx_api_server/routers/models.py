@@ -18,6 +18,7 @@ from whisperx_api_server.models import (
     align_model_instances,
     diarize_model_instances,
     unload_model_object,
+    unload_whisper_model,
 )
 
 logger = logging.getLogger(__name__)
@@ -53,10 +54,10 @@ def list_models():
 def unload_model(model: Annotated[ModelName, Form()]):
     try:
         if model in model_instances:
-            model_data = model_instances.pop(model, None)
-            if model_data is not None:
-                unload_model_object(model_data)
-            response_data = {"status": "success"}
+            if unload_whisper_model(model):
+                response_data = {"status": "success"}
+            else:
+                response_data = {"status": "error", "message": f"Model {model} is in use"}
         else:
             response_data = {"status": "error", "message": f"Model {model} not found"}
         return JSONResponse(content=response_data, media_type=MediaType.APPLICATION_JSON)
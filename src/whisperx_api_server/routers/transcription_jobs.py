@@ -2,18 +2,24 @@
 Transcription Job API endpoints - Async job queue system.
 """
 
-import json
 import logging
 import os
 import uuid
-from typing import Optional
+from typing import Iterator, Optional
 
+import orjson
 from fastapi import APIRouter, Depends, File, Form, HTTPException, UploadFile
-from sqlalchemy.orm import Session
+from fastapi.responses import Response, StreamingResponse
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
 
-from whisperx_api_server.dependencies import get_config
 from whisperx_api_server.database import get_db
-from whisperx_api_server.db_models import TranscriptionJob
+from whisperx_api_server.db_models import (
+    TranscriptionJob,
+    iter_transcript_segments,
+    unpack_transcript,
+)
+from whisperx_api_server.services.worker import worker
 from whisperx_api_server.schemas import (
     TranscriptionJobResponse,
     TranscriptionJobListResponse,
@@ -23,54 +29,86 @@ from whisperx_api_server.schemas import (
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/v1/audio/transcriptions", tags=["transcription-jobs"])
+router = APIRouter(
+    prefix="/v1/audio/transcriptions",
+    tags=["transcription-jobs"],
+)
+
+# Read size used when streaming uploads to disk
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+
+# Uploaded audio is stored here until the worker has processed it
+UPLOAD_DIR = os.getenv("UPLOAD_DIR", "/workspace/data/uploads")
+os.makedirs(UPLOAD_DIR, exist_ok=True)
+
+
+# Job columns returned as-is in TranscriptionJobResponse
+_RESPONSE_COLUMNS = (
+    TranscriptionJob.id,
+    TranscriptionJob.status,
+    TranscriptionJob.original_filename,
+    TranscriptionJob.model,
+    TranscriptionJob.language,
+    TranscriptionJob.diarize,
+    TranscriptionJob.min_speakers,
+    TranscriptionJob.max_speakers,
+    TranscriptionJob.chunk_size,
+    TranscriptionJob.duration,
+    TranscriptionJob.processing_time,
+    TranscriptionJob.error_message,
+    TranscriptionJob.created_at,
+    TranscriptionJob.updated_at,
+    TranscriptionJob.completed_at,
+)
+
+
+def _segment_fields(seg: dict) -> dict:
+    """
+    Project a stored segment onto the TranscriptSegment fields. Times are
+    coerced to float since some responses are serialized without the schema.
+    """
+    return {
+        "start": float(seg.get("start") or 0),
+        "end": float(seg.get("end") or 0),
+        "text": seg.get("text", ""),
+        "speaker": seg.get("speaker"),
+    }
+
+
+def _transcript_fields(job_id: str, blob: Optional[bytes]) -> dict:
+    """
+    Decode a transcript blob into the `text`, `segments` and `detected_language`
+    response fields. All are None if there is no transcript or it is corrupt.
+    """
+    fields = {"text": None, "segments": None, "detected_language": None}
+    if not blob:
+        return fields
+
+    try:
+        transcript_data = unpack_transcript(blob)
+    except ValueError:
+        logger.warning(f"Failed to decode transcript for job {job_id}")
+        return fields
+
+    fields["text"] = transcript_data.get("text")
+    fields["detected_language"] = transcript_data.get("language")
+    fields["segments"] = [_segment_fields(seg) for seg in transcript_data.get("segments", [])]
+    return fields
 
 
 def _job_to_response(job: TranscriptionJob) -> TranscriptionJobResponse:
-    """Convert a database job to a response schema."""
-    # Parse transcript JSON if present
-    text = None
-    segments = None
-    detected_language = None
+    """
+    Convert a database job to a response schema.
 
-    if job.transcript:
-        try:
-            transcript_data = json.loads(job.transcript)
-            text = transcript_data.get("text")
-            detected_language = transcript_data.get("language")
-            raw_segments = transcript_data.get("segments", [])
-            segments = [
-                TranscriptSegment(
-                    start=seg.get("start", 0),
-                    end=seg.get("end", 0),
-                    text=seg.get("text", ""),
-                    speaker=seg.get("speaker"),
-                )
-                for seg in raw_segments
-            ]
-        except json.JSONDecodeError:
-            logger.warning(f"Failed to parse transcript JSON for job {job.id}")
-
-    return TranscriptionJobResponse(
-        id=job.id,
-        status=job.status,
-        original_filename=job.original_filename,
-        model=job.model,
-        language=job.language,
-        diarize=job.diarize,
-        min_speakers=job.min_speakers,
-        max_speakers=job.max_speakers,
-        chunk_size=job.chunk_size,
-        text=text,
-        segments=segments,
-        detected_language=detected_language,
-        duration=job.duration,
-        processing_time=job.processing_time,
-        error_message=job.error_message,
-        created_at=job.created_at,
-        updated_at=job.updated_at,
-        completed_at=job.completed_at,
-    )
+    Rows come from our own database, so the schemas are built with
+    model_construct() and skip validation.
+    """
+    fields = {column.key: getattr(job, column.key) for column in _RESPONSE_COLUMNS}
+    fields.update(_transcript_fields(job.id, job.transcript_blob))
+    if fields["segments"] is not None:
+        fields["segments"] = [TranscriptSegment.model_construct(**seg) for seg in fields["segments"]]
+
+    return TranscriptionJobResponse.model_construct(**fields)
 
 
 @router.post(
@@ -90,27 +128,26 @@ async def create_job(
     chunk_size: int = Form(default=15, description="Chunk size in seconds"),
     vad_onset: float = Form(default=0.5, description="VAD onset threshold"),
     vad_offset: float = Form(default=0.363, description="VAD offset threshold"),
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_db),
 ):
     """Create a new transcription job."""
 
-    config = get_config()
-    upload_dir = os.getenv("UPLOAD_DIR", "/workspace/data/uploads")
-    
-    # Ensure upload directory exists
-    os.makedirs(upload_dir, exist_ok=True)
-
     # Generate job ID and save file
     job_id = str(uuid.uuid4())
     file_ext = os.path.splitext(file.filename or "audio.wav")[1] or ".wav"
-    audio_path = os.path.join(upload_dir, f"{job_id}{file_ext}")
+    # Shard uploads on the first two hex chars of the ID to keep directories small
+    audio_dir = os.path.join(UPLOAD_DIR, job_id[:2])
+    os.makedirs(audio_dir, exist_ok=True)
+    audio_path = os.path.join(audio_dir, f"{job_id}{file_ext}")
 
     try:
-        # Save uploaded file
-        contents = await file.read()
+        # Stream uploaded file to disk in chunks to keep memory flat
+        size = 0
         with open(audio_path, "wb") as f:
-            f.write(contents)
-        logger.info(f"Saved audio file: {audio_path} ({len(contents)} bytes)")
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                f.write(chunk)
+                size += len(chunk)
+        logger.info(f"Saved audio file: {audio_path} ({size} bytes)")
     except Exception as e:
         logger.error(f"Failed to save audio file: {e}")
         raise HTTPException(status_code=500, detail="Failed to save audio file")
@@ -132,8 +169,11 @@ async def create_job(
     )
 
     db.add(job)
-    db.commit()
-    db.refresh(job)
+    await db.commit()
+    await db.refresh(job)
+
+    # Wake the background worker instead of waiting for its next poll
+    worker.notify()
 
     logger.info(f"Created job: {job.id}")
     return _job_to_response(job)
@@ -143,34 +183,49 @@ async def create_job(
     "/jobs",
     response_model=TranscriptionJobListResponse,
     summary="List transcription jobs",
-    description="Get a paginated list of all transcription jobs.",
+    description="Get a paginated list of all transcription jobs. Transcripts are omitted unless `include_transcript` is set.",
 )
 async def list_jobs(
     page: int = 1,
     limit: int = 20,
     status: Optional[str] = None,
-    db: Session = Depends(get_db),
+    include_transcript: bool = False,
+    db: AsyncSession = Depends(get_db),
 ):
     """List all transcription jobs with pagination."""
 
-    # Build query
-    query = db.query(TranscriptionJob)
+    # Build a Core query returning plain rows; skip fetching transcripts
+    # unless the client asked for them
+    columns = _RESPONSE_COLUMNS
+    if include_transcript:
+        columns += (TranscriptionJob.transcript_blob,)
+    query = select(*columns)
+    count_query = select(func.count()).select_from(TranscriptionJob)
 
     if status:
-        query = query.filter(TranscriptionJob.status == status)
+        query = query.where(TranscriptionJob.status == status)
+        count_query = count_query.where(TranscriptionJob.status == status)
 
     # Get total count
-    total = query.count()
+    total = await db.scalar(count_query)
 
     # Apply pagination
     offset = (page - 1) * limit
-    jobs = query.order_by(TranscriptionJob.created_at.desc()).offset(offset).limit(limit).all()
-
-    return TranscriptionJobListResponse(
-        jobs=[_job_to_response(job) for job in jobs],
-        total=total,
-        page=page,
-        limit=limit,
+    rows = (await db.execute(
+        query.order_by(TranscriptionJob.created_at.desc()).offset(offset).limit(limit)
+    )).mappings().all()
+
+    # Serialize the rows directly, without ORM objects or Pydantic models
+    jobs = []
+    for row in rows:
+        job = dict(row)
+        blob = job.pop("transcript_blob", None)
+        job.update(_transcript_fields(job["id"], blob))
+        jobs.append(job)
+
+    return Response(
+        content=orjson.dumps({"jobs": jobs, "total": total, "page": page, "limit": limit}),
+        media_type="application/json",
     )
 
 
@@ -181,10 +236,10 @@ async def list_jobs(
     summary="Get job details",
     description="Get the details and status of a specific transcription job.",
 )
-async def get_job(job_id: str, db: Session = Depends(get_db)):
+async def get_job(job_id: str, db: AsyncSession = Depends(get_db)):
     """Get a specific transcription job."""
 
-    job = db.query(TranscriptionJob).filter(TranscriptionJob.id == job_id).first()
+    job = await db.get(TranscriptionJob, job_id)
 
     if not job:
         raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
@@ -192,16 +247,55 @@ async def get_job(job_id: str, db: Session = Depends(get_db)):
     return _job_to_response(job)
 
 
+def _segments_to_jsonl(job_id: str, segments: Iterator[dict]) -> Iterator[bytes]:
+    """Yield each transcript segment as one JSON line."""
+    try:
+        for seg in segments:
+            yield orjson.dumps(_segment_fields(seg)) + b"\n"
+    except ValueError:
+        # Headers are already sent; the client sees a truncated body
+        logger.warning(f"Failed to decode transcript for job {job_id}")
+
+
+@router.get(
+    "/jobs/{job_id}/transcript.jsonl",
+    responses={404: {"model": ErrorResponse}, 500: {"model": ErrorResponse}},
+    summary="Stream job transcript segments",
+    description="Stream the segments of a completed job's transcript as newline-delimited JSON, one segment per line.",
+)
+async def stream_transcript(job_id: str, db: AsyncSession = Depends(get_db)):
+    """Stream the transcript segments of a transcription job."""
+
+    job = await db.get(TranscriptionJob, job_id)
+
+    if not job:
+        raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
+
+    if not job.transcript_blob:
+        raise HTTPException(status_code=404, detail=f"Transcript not available for job: {job_id}")
+
+    try:
+        segments = iter_transcript_segments(job.transcript_blob)
+    except ValueError:
+        logger.warning(f"Failed to decode transcript for job {job_id}")
+        raise HTTPException(status_code=500, detail=f"Failed to decode transcript for job: {job_id}")
+
+    return StreamingResponse(
+        _segments_to_jsonl(job.id, segments),
+        media_type="application/x-ndjson",
+    )
+
+
 @router.delete(
     "/jobs/{job_id}",
     responses={404: {"model": ErrorResponse}},
     summary="Delete a job",
     description="Delete a transcription job and its associated data.",
 )
-async def delete_job(job_id: str, db: Session = Depends(get_db)):
+async def delete_job(job_id: str, db: AsyncSession = Depends(get_db)):
     """Delete a transcription job."""
 
-    job = db.query(TranscriptionJob).filter(TranscriptionJob.id == job_id).first()
+    job = await db.get(TranscriptionJob, job_id)
 
     if not job:
         raise HTTPException(status_code=404, detail=f"Job not found: {job_id}")
@@ -214,8 +308,8 @@ async def delete_job(job_id: str, db: Session = Depends(get_db)):
             logger.warning(f"Failed to delete audio file: {e}")
 
     # Delete job record
-    db.delete(job)
-    db.commit()
+    await db.delete(job)
+    await db.commit()
 
     logger.info(f"Deleted job: {job_id}")
     return {"message": f"Job {job_id} deleted"}
@@ -24,7 +24,8 @@ from whisperx_api_server.config import (
     ResponseFormat,
 )
 from whisperx_api_server.models import (
-    load_model_instance,
+    acquire_model_instance,
+    release_model_instance,
 )
 
 logger = logging.getLogger(__name__)
@@ -164,7 +165,7 @@ async def transcribe_audio(
 
     model_load_time = time.time()
     # Get model instance (reuse if cached)
-    model_instance = await load_model_instance(model)
+    model_instance = await acquire_model_instance(model)
 
     logger.info(f"Loaded model {model} in {time.time() - model_load_time:.2f} seconds")
 
@@ -185,6 +186,8 @@ async def transcribe_audio(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
             detail="An unexpected error occurred while processing the transcription request."
         ) from e
+    finally:
+        release_model_instance(model)
 
     total_time = time.time() - start_time
     logger.info(f"Request ID: {request_id} - Transcription process took {total_time:.2f} seconds")
@@ -240,7 +243,7 @@ async def translate_audio(
 
     model_load_time = time.time()
     # Get model instance (reuse if cached)
-    model_instance = await load_model_instance(model)
+    model_instance = await acquire_model_instance(model)
 
     logger.info(f"Loaded model {model} in {time.time() - model_load_time:.2f} seconds")
 
@@ -259,6 +262,8 @@ async def translate_audio(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR, 
             detail="An unexpected error occurred while processing the translation request."
         ) from e
+    finally:
+        release_model_instance(model)
 
     total_time = time.time() - start_time
     logger.info(f"Request ID: {request_id} - Translation process took {total_time:.2f} seconds")
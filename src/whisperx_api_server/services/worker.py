@@ -2,153 +2,200 @@
 Background worker for processing transcription jobs.
 """
 
-import json
 import logging
 import os
 import threading
 import time
 import asyncio
-from datetime import datetime
-from typing import Optional
+from collections import OrderedDict
+from typing import Any, Optional
 
-from sqlalchemy.orm import Session
+from sqlalchemy import func, select, update
 
-from whisperx_api_server.database import SessionLocal
-from whisperx_api_server.db_models import TranscriptionJob
+from whisperx_api_server.database import create_async_db_engine, create_session_factory
+from whisperx_api_server.db_models import TranscriptionJob, pack_transcript
 from whisperx_api_server import transcriber
-from whisperx_api_server.models import load_model_instance
+from whisperx_api_server.models import (
+    acquire_model_instance,
+    release_model_instance,
+    unload_whisper_model,
+)
 
 logger = logging.getLogger(__name__)
 
+# Number of Whisper models the worker keeps loaded between jobs
+MODEL_CACHE_SIZE = max(1, int(os.getenv("MODEL_CACHE_SIZE", "2")))
+
+# Number of worker threads processing jobs in parallel. GPU work is still
+# limited by MAX_CONCURRENT_TRANSCRIPTIONS in the transcriber, so extra
+# threads overlap audio decoding and DB writes with inference.
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "1"))
+
 
 class TranscriptionWorker:
     """
     Background worker that processes pending transcription jobs.
-    Runs in a separate thread and polls for new jobs.
+    Runs `num_threads` threads that sleep until notified of a new job,
+    falling back to polling every `poll_interval` seconds.
     """
 
-    def __init__(self, poll_interval: float = 2.0):
+    def __init__(self, poll_interval: float = 2.0, num_threads: int = JOB_WORKERS):
         """
         Initialize the worker.
 
         Args:
-            poll_interval: How often to check for new jobs (in seconds)
+            poll_interval: Maximum time to wait between checks for new jobs (in seconds)
+            num_threads: Number of threads claiming and processing jobs
         """
         self._poll_interval = poll_interval
-        self._thread: Optional[threading.Thread] = None
+        self._num_threads = max(1, num_threads)
+        self._threads: list[threading.Thread] = []
         self._running = False
-        self._current_job_id: Optional[str] = None
+        self._wakeup = threading.Event()
+        # Per-thread state: each thread owns a long-lived event loop, reused for
+        # every job, and an async engine bound to it (see create_async_db_engine)
+        self._local = threading.local()
+        # Most recently used model names, oldest first; shared by all threads.
+        # The models themselves stay in models.model_instances, so the worker
+        # holds no reference that /models/unload can't release.
+        self._model_cache: OrderedDict[str, None] = OrderedDict()
+        self._model_cache_lock = threading.Lock()
+        # Job currently processed by each thread, keyed by thread name
+        self._current_job_ids: dict[str, str] = {}
 
     def start(self):
-        """Start the background worker thread."""
-        if self._thread is not None and self._thread.is_alive():
+        """Start the background worker threads."""
+        if any(thread.is_alive() for thread in self._threads):
             logger.warning("Worker is already running")
             return
 
         self._running = True
-        self._thread = threading.Thread(target=self._run, daemon=True)
-        self._thread.start()
-        logger.info("Transcription worker started")
+        self._threads = [
+            threading.Thread(target=self._run, name=f"transcription-worker-{i}", daemon=True)
+            for i in range(self._num_threads)
+        ]
+        for thread in self._threads:
+            thread.start()
+        logger.info(f"Transcription worker started with {self._num_threads} thread(s)")
 
     def stop(self):
-        """Stop the background worker thread."""
+        """Stop the background worker threads."""
         self._running = False
-        if self._thread is not None:
-            self._thread.join(timeout=5.0)
-            self._thread = None
+        self._wakeup.set()
+        for thread in self._threads:
+            thread.join(timeout=5.0)
+        self._threads = []
         logger.info("Transcription worker stopped")
 
+    def notify(self):
+        """Wake the worker threads so a newly created job is picked up immediately."""
+        self._wakeup.set()
+
     def is_running(self) -> bool:
         """Check if the worker is running."""
-        return self._running and self._thread is not None and self._thread.is_alive()
+        return self._running and any(thread.is_alive() for thread in self._threads)
 
     def get_status(self) -> str:
         """Get the worker status."""
         if not self.is_running():
             return "stopped"
-        if self._current_job_id:
-            return f"processing:{self._current_job_id}"
+        job_ids = list(self._current_job_ids.values())
+        if job_ids:
+            return f"processing:{','.join(job_ids)}"
         return "idle"
 
     def _run(self):
-        """Main worker loop."""
+        """Main worker loop, run by each worker thread."""
         logger.info("Worker loop started")
 
-        while self._running:
-            try:
-                job = self._get_next_job()
-                if job:
-                    self._process_job(job)
-                else:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        engine = create_async_db_engine(pool_size=1, max_overflow=0)
+        self._local.session_factory = create_session_factory(engine)
+
+        try:
+            while self._running:
+                try:
+                    # Clear before claiming, never after waiting: a notify() that
+                    # lands after the claim attempt stays set for the wait below,
+                    # and one that lands before it is covered by the claim itself.
+                    self._wakeup.clear()
+                    job = loop.run_until_complete(self._get_next_job())
+                    if job:
+                        loop.run_until_complete(self._process_job(job))
+                    else:
+                        self._wakeup.wait(timeout=self._poll_interval)
+                except Exception as e:
+                    logger.error(f"Worker error: {e}", exc_info=True)
                     time.sleep(self._poll_interval)
-            except Exception as e:
-                logger.error(f"Worker error: {e}", exc_info=True)
-                time.sleep(self._poll_interval)
+        finally:
+            # The loop is only ever driven by run_until_complete from this
+            # thread, so it is never running here and can be closed safely.
+            loop.run_until_complete(engine.dispose())
+            loop.close()
+            self._local.session_factory = None
 
         logger.info("Worker loop ended")
 
-    def _get_next_job(self) -> Optional[TranscriptionJob]:
+    async def _get_next_job(self) -> Optional[TranscriptionJob]:
         """
-        Get the next pending job and mark it as processing.
+        Atomically claim the oldest pending job by marking it as processing.
+
+        The claim is a single UPDATE ... RETURNING statement, so two workers
+        can never pick up the same job.
         """
-        db = SessionLocal()
-        try:
-            job = (
-                db.query(TranscriptionJob)
-                .filter(TranscriptionJob.status == "pending")
-                .order_by(TranscriptionJob.created_at.asc())
-                .first()
-            )
+        async with self._local.session_factory() as db:
+            try:
+                next_pending = (
+                    select(TranscriptionJob.id)
+                    .where(TranscriptionJob.status == "pending")
+                    .order_by(TranscriptionJob.created_at.asc())
+                    .limit(1)
+                    .scalar_subquery()
+                )
+                job = (await db.execute(
+                    update(TranscriptionJob)
+                    .where(TranscriptionJob.id == next_pending)
+                    .values(status="processing")
+                    .returning(TranscriptionJob)
+                    .execution_options(synchronize_session=False)
+                )).scalar_one_or_none()
 
-            if job:
-                job.status = "processing"
-                db.commit()
-                db.refresh(job)
-                logger.info(f"Picked up job: {job.id}")
-                return job
+                # RETURNING already loaded every column and the session doesn't
+                # expire on commit, so nothing re-fetches the row later.
+                await db.commit()
 
-            return None
-        except Exception as e:
-            db.rollback()
-            logger.error(f"Error getting next job: {e}")
-            return None
-        finally:
-            db.close()
+                if job:
+                    logger.info(f"Picked up job: {job.id}")
+                    return job
+
+                return None
+            except Exception as e:
+                await db.rollback()
+                logger.error(f"Error getting next job: {e}")
+                return None
 
-    def _process_job(self, job: TranscriptionJob):
+    async def _process_job(self, job: TranscriptionJob):
         """
         Process a transcription job using Nyralei's transcriber.
         """
-        self._current_job_id = job.id
-        db = SessionLocal()
+        thread_name = threading.current_thread().name
+        self._current_job_ids[thread_name] = job.id
+        db = self._local.session_factory()
+        model_instance = None
 
         try:
             logger.info(f"Processing job {job.id}")
             
-            # Create a temporary file-like object from the saved audio path
-            class FakeUploadFile:
-                def __init__(self, filepath):
-                    self.filepath = filepath
-                    self.filename = os.path.basename(filepath)
-                    
-                async def read(self):
-                    with open(self.filepath, 'rb') as f:
-                        return f.read()
-            
-            fake_file = FakeUploadFile(job.audio_path)
-            
-            # Run transcription using Nyralei's async transcriber in a new event loop
-            loop = asyncio.new_event_loop()
-            asyncio.set_event_loop(loop)
-            
+            # Run transcription using Nyralei's async transcriber on the worker's event loop
             start_time = time.time()
             
             # Load model instance
-            model_instance = loop.run_until_complete(load_model_instance(job.model))
+            model_instance = await self._get_model(job.model)
             
             # Run transcription
-            result = loop.run_until_complete(transcriber.transcribe(
-                audio_file=fake_file,
+            result = await transcriber.transcribe(
+                audio_file=job.audio_path,
                 batch_size=16,
                 chunk_size=job.chunk_size,
                 asr_options={},
@@ -158,33 +205,33 @@ class TranscriptionWorker:
                 diarize=job.diarize,
                 request_id=job.id,
                 task="transcribe",
-            ))
-            
-            loop.close()
+            )
             
             processing_time = time.time() - start_time
 
-            # Update job in database
-            job = db.query(TranscriptionJob).filter(TranscriptionJob.id == job.id).first()
-            
-            job.status = "completed"
-            
             # Extract data from result
             segments = result.get("segments", [])
             if isinstance(segments, dict):
                 segments = segments.get("segments", [])
-                
-            job.transcript = json.dumps({
-                "text": result.get("text", ""),
-                "segments": segments,
-                "language": result.get("language", ""),
-            })
-            job.duration = result.get("duration")
-            job.processing_time = processing_time
-            job.completed_at = datetime.utcnow()
-            logger.info(f"Job {job.id} completed successfully in {processing_time:.2f}s")
 
-            db.commit()
+            # Update job in database; this worker owns the row, so no need to re-read it
+            await db.execute(
+                update(TranscriptionJob)
+                .where(TranscriptionJob.id == job.id)
+                .values(
+                    status="completed",
+                    transcript_blob=pack_transcript({
+                        "text": result.get("text", ""),
+                        "segments": segments,
+                        "language": result.get("language", ""),
+                    }),
+                    duration=result.get("duration"),
+                    processing_time=processing_time,
+                    completed_at=func.now(),
+                )
+            )
+            await db.commit()
+            logger.info(f"Job {job.id} completed successfully in {processing_time:.2f}s")
 
             # Delete audio file after processing
             self._cleanup_audio_file(job.audio_path)
@@ -194,21 +241,66 @@ class TranscriptionWorker:
 
             # Update job status to failed
             try:
-                job = db.query(TranscriptionJob).filter(TranscriptionJob.id == job.id).first()
-                if job:
-                    job.status = "failed"
-                    job.error_message = str(e)
-                    job.processing_time = time.time() - start_time if 'start_time' in locals() else None
-                    db.commit()
+                await db.rollback()
+                await db.execute(
+                    update(TranscriptionJob)
+                    .where(TranscriptionJob.id == job.id)
+                    .values(
+                        status="failed",
+                        error_message=str(e),
+                        processing_time=time.time() - start_time if 'start_time' in locals() else None,
+                    )
+                )
+                await db.commit()
 
-                    # Still try to clean up audio file
-                    self._cleanup_audio_file(job.audio_path)
+                # Still try to clean up audio file
+                self._cleanup_audio_file(job.audio_path)
             except Exception as update_error:
                 logger.error(f"Error updating failed job: {update_error}")
-                db.rollback()
+                await db.rollback()
         finally:
-            db.close()
-            self._current_job_id = None
+            if model_instance is not None:
+                self._release_model(job.model)
+            await db.close()
+            self._current_job_ids.pop(thread_name, None)
+
+    async def _get_model(self, model_name: str) -> Any:
+        """
+        Return the model for `model_name`, loading it if needed. It stays in use,
+        and so is never unloaded, until `_release_model` is called.
+
+        The cache is shared by all worker threads, each on its own event loop,
+        so it is guarded by a thread lock rather than an asyncio one. The lock
+        is never held across an await.
+        """
+        model = await acquire_model_instance(model_name)
+        with self._model_cache_lock:
+            self._model_cache[model_name] = None
+            self._model_cache.move_to_end(model_name)
+            self._evict_models()
+        return model
+
+    def _release_model(self, model_name: str):
+        """
+        Mark one use of `model_name` as finished and evict any idle models
+        beyond MODEL_CACHE_SIZE.
+        """
+        release_model_instance(model_name)
+        with self._model_cache_lock:
+            self._evict_models()
+
+    def _evict_models(self):
+        """
+        Unload the least recently used models until at most MODEL_CACHE_SIZE
+        remain, skipping any still in use by a job or an API request. Caller
+        must hold `_model_cache_lock`.
+        """
+        for evicted_name in list(self._model_cache):
+            if len(self._model_cache) <= MODEL_CACHE_SIZE:
+                break
+            if unload_whisper_model(evicted_name):
+                del self._model_cache[evicted_name]
+                logger.info(f"Evicted model from worker cache: {evicted_name}")
 
     def _cleanup_audio_file(self, audio_path: str):
         """
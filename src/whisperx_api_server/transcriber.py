@@ -10,6 +10,7 @@ import logging
 import time
 import tempfile
 import asyncio
+import threading
 import torch
 import gc
 
@@ -19,6 +20,7 @@ from whisperx_api_server.config import (
 from whisperx_api_server.dependencies import get_config
 from whisperx_api_server.models import (
     CustomWhisperModel,
+    acquire_thread_lock,
     load_align_model_cached,
     load_diarize_model_cached,
     load_transcribe_pipeline_cached,
@@ -29,15 +31,23 @@ logger = logging.getLogger(__name__)
 config = get_config()
 
 _concurrency_semaphore = None
-
-def _get_concurrency_semaphore() -> asyncio.Semaphore | None:
-    """Return a semaphore only if running on GPU."""
+_concurrency_semaphore_lock = threading.Lock()
+
+def _get_concurrency_semaphore() -> threading.BoundedSemaphore | None:
+    """
+    Return a semaphore only if running on GPU.
+    It is a thread semaphore because transcriptions run on the API's event loop
+    and on each job worker thread's own loop.
+    """
     global _concurrency_semaphore
     if not torch.cuda.is_available():
         return None
-    if _concurrency_semaphore is None:
-        max_concurrent = int(os.getenv("MAX_CONCURRENT_TRANSCRIPTIONS", "1"))
-        _concurrency_semaphore = asyncio.Semaphore(max_concurrent)
+    # Guarded so two threads starting at once can't each create their own
+    # semaphore and double the GPU bound
+    with _concurrency_semaphore_lock:
+        if _concurrency_semaphore is None:
+            max_concurrent = int(os.getenv("MAX_CONCURRENT_TRANSCRIPTIONS", "1"))
+            _concurrency_semaphore = threading.BoundedSemaphore(max_concurrent)
     return _concurrency_semaphore
 
 def _cleanup_cache_only():
@@ -70,9 +80,11 @@ async def _save_upload_to_temp(audio_file: UploadFile, request_id: str) -> str:
 
 async def _load_audio(file_path: str, request_id: str):
     loop = asyncio.get_running_loop()
+    audio_loading_start = time.time()
     try:
         audio = await loop.run_in_executor(None, whisperx_audio.load_audio, file_path)
         logger.info(f"Request ID: {request_id} - Audio loaded from {file_path}")
+        logger.info(f"Request ID: {request_id} - Loading audio took {time.time() - audio_loading_start:.2f} seconds")
         return audio
     except Exception as e:
         logger.error(f"Request ID: {request_id} - Failed to load audio: {e}")
@@ -156,7 +168,7 @@ def _finalize_text(result, align_or_diarize: bool):
     return result
 
 async def transcribe(
-    audio_file: UploadFile,
+    audio_file: UploadFile | str,
     batch_size: int = config.batch_size,
     chunk_size: int = 30,
     asr_options: dict = {},
@@ -169,18 +181,37 @@ async def transcribe(
 ) -> whisperx_types.TranscriptionResult:
     start_time = time.time()
     file_path = None
+    temp_file_path = None
     audio = None
     concurrency_sem = _get_concurrency_semaphore()
+    sem_acquired = False
+
+    # A path means the audio is already on disk (job queue); only uploads need staging
+    if isinstance(audio_file, str):
+        file_path = audio_file
+        filename = os.path.basename(audio_file)
+    else:
+        filename = audio_file.filename
 
     try:
-        file_path = await _save_upload_to_temp(audio_file, request_id)
-        logger.info(f"Request ID: {request_id} - Saving uploaded file took {time.time() - start_time:.2f} seconds")
+        if file_path is None:
+            file_path = temp_file_path = await _save_upload_to_temp(audio_file, request_id)
+            logger.info(f"Request ID: {request_id} - Saving uploaded file took {time.time() - start_time:.2f} seconds")
+
+        # Queued jobs decode before taking the GPU so it overlaps with other
+        # transcriptions; the worker pool bounds how many are decoded at once.
+        # Uploads have no such bound, so they decode only once they hold the GPU.
+        if isinstance(audio_file, str):
+            audio = await _load_audio(file_path, request_id)
 
         if concurrency_sem:
-            await concurrency_sem.acquire()
+            # Poll rather than wait in an executor thread: waiters would tie up the
+            # threads the holder needs, and a cancelled waiter would leak the permit
+            await acquire_thread_lock(concurrency_sem)
+            sem_acquired = True
             logger.debug(f"Request ID: {request_id} - Acquired GPU concurrency semaphore")
 
-        logger.info(f"Request ID: {request_id} - Transcribing {audio_file.filename} with model: {whispermodel.model_size_or_path} and options: {asr_options}, language: {language}, task: {task}")
+        logger.info(f"Request ID: {request_id} - Transcribing {filename} with model: {whispermodel.model_size_or_path} and options: {asr_options}, language: {language}, task: {task}")
         
         model_loading_start = time.time()
 
@@ -192,11 +223,8 @@ async def transcribe(
 
         logger.info(f"Request ID: {request_id} - Loading model took {time.time() - model_loading_start:.2f} seconds (cached)")
 
-        audio_loading_start = time.time()
-
-        audio = await _load_audio(file_path, request_id)
-        
-        logger.info(f"Request ID: {request_id} - Loading audio took {time.time() - audio_loading_start:.2f} seconds")
+        if audio is None:
+            audio = await _load_audio(file_path, request_id)
 
         transcription_start = time.time()
 
@@ -212,19 +240,19 @@ async def transcribe(
 
         result = _finalize_text(result, align or diarize)
 
-        logger.info(f"Request ID: {request_id} - Transcription completed for {audio_file.filename}")
+        logger.info(f"Request ID: {request_id} - Transcription completed for {filename}")
 
         return result
     except Exception as e:
-        logger.error(f"Request ID: {request_id} - Transcription failed for {audio_file.filename} with error: {e}")
+        logger.error(f"Request ID: {request_id} - Transcription failed for {filename} with error: {e}")
         raise
     finally:
         with contextlib.suppress(Exception):
-            if concurrency_sem:
+            if sem_acquired:
                 concurrency_sem.release()
         with contextlib.suppress(Exception):
-            if file_path and os.path.exists(file_path):
-                os.remove(file_path)
+            if temp_file_path and os.path.exists(temp_file_path):
+                os.remove(temp_file_path)
         if config.audio_cleanup and audio is not None:
             del audio
             logger.info(f"Request ID: {request_id} - Audio data cleaned up")